@@ -4,7 +4,7 @@ import csv
 import pathlib
 import time
 from dataclasses import dataclass, field
-from typing import Dict, Iterable
+from typing import Dict, Iterable, List
 
 
 @dataclass
@@ -12,8 +12,10 @@ class DataLogger:
     output_path: pathlib.Path
     fieldnames: Iterable[str]
     append: bool = True
+    flush_every: int = 30  # buffer this many rows before writing
     _writer: csv.DictWriter | None = field(init=False, default=None)
     _file: object | None = field(init=False, default=None)
+    _pending: List[Dict[str, float]] = field(init=False, default_factory=list)
 
     def __post_init__(self) -> None:
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -27,11 +29,19 @@ class DataLogger:
         assert self._writer is not None
         row = {name: metrics.get(name) for name in self.fieldnames}
         row["timestamp"] = time.time()
-        self._writer.writerow(row)
-        self._file.flush()  # type: ignore[union-attr]
+        self._pending.append(row)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending and self._writer is not None:
+            self._writer.writerows(self._pending)
+            self._pending.clear()
+            self._file.flush()  # type: ignore[union-attr]
 
     def close(self) -> None:
         if self._file is not None:
+            self.flush()
             self._file.close()
             self._file = None
             self._writer = None
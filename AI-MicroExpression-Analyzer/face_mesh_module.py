@@ -94,7 +94,15 @@ def iter_landmarks_from_camera(
     width: int = 640,
     height: int = 480,
     fps: int = 30,
+    detect_width: Optional[int] = None,
 ) -> Generator[LandmarkFrame, None, None]:
+    """Yield landmark frames from the camera.
+
+    When ``detect_width`` is set, frames are downscaled to that width
+    before detection — landmark coordinates are normalized, so they
+    need no fix-up — while the full-resolution image is kept on the
+    yielded frame for display.
+    """
     cap = cv2.VideoCapture(camera_index)
     if not cap.isOpened():
         raise RuntimeError("Unable to open camera.")
@@ -108,9 +116,18 @@ def iter_landmarks_from_camera(
                 success, frame = cap.read()
                 if not success:
                     break
-                landmark_frame = processor.process(frame)
+                detect_input = frame
+                if detect_width is not None and frame.shape[1] > detect_width:
+                    detect_height = round(frame.shape[0] * detect_width / frame.shape[1])
+                    detect_input = cv2.resize(
+                        frame,
+                        (detect_width, detect_height),
+                        interpolation=cv2.INTER_AREA,
+                    )
+                landmark_frame = processor.process(detect_input)
                 if landmark_frame is None:
                     continue
+                landmark_frame.image = frame
                 yield landmark_frame
         finally:
             cap.release()
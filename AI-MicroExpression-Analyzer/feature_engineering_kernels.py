@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the plain function
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+# Landmark indices approximated from MediaPipe Face Mesh topology
+LEFT_EYE_LIDS = (159, 145)
+RIGHT_EYE_LIDS = (386, 374)
+LEFT_EYE_HORIZONTAL = (33, 133)
+RIGHT_EYE_HORIZONTAL = (362, 263)
+LEFT_EYEBROW = (55, 107, 46)
+RIGHT_EYEBROW = (285, 336, 276)
+LEFT_LIP_CORNER = 61
+RIGHT_LIP_CORNER = 291
+TOP_LIP = 13
+BOTTOM_LIP = 14
+NOSE_TIP = 1
+CHIN = 152
+LEFT_CHEEK = 234
+RIGHT_CHEEK = 454
+
+
+@njit(cache=True, fastmath=True)
+def _dist(landmarks: np.ndarray, a: int, b: int) -> float:
+    # Component-wise scalar math: no 3-element temporaries, and
+    # math.sqrt is far cheaper than a NumPy reduction on the
+    # uncompiled fallback path.
+    dx = landmarks[0, a] - landmarks[0, b]
+    dy = landmarks[1, a] - landmarks[1, b]
+    dz = landmarks[2, a] - landmarks[2, b]
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+@njit(cache=True, fastmath=True)
+def compute_geometry(
+    landmarks: np.ndarray, prev_nose_y: float, has_prev: bool
+) -> tuple[float, float, float, float, float, float]:
+    """Compute the raw per-frame geometry scalars in one compiled pass.
+
+    Takes the landmarks as a contiguous ``(3, 478)`` float32 array (one
+    row per component, so the y-only metrics read a contiguous stripe)
+    and the previous frame's nose height; pass ``has_prev=False`` on the
+    first frame, when no previous height exists. (``has_prev`` is an
+    explicit flag because fastmath assumes no NaNs, so a NaN sentinel
+    would not survive compilation.) Returns
+    ``(eye_ratio, brow_raise, lip_ratio, nod_delta, symmetry, nose_y)``;
+    smoothing and blink bookkeeping stay with the caller.
+    """
+    # Eye aspect ratio, averaged over both eyes
+    left_ratio = _dist(landmarks, LEFT_EYE_LIDS[0], LEFT_EYE_LIDS[1]) / max(
+        _dist(landmarks, LEFT_EYE_HORIZONTAL[0], LEFT_EYE_HORIZONTAL[1]), 1e-5
+    )
+    right_ratio = _dist(landmarks, RIGHT_EYE_LIDS[0], RIGHT_EYE_LIDS[1]) / max(
+        _dist(landmarks, RIGHT_EYE_HORIZONTAL[0], RIGHT_EYE_HORIZONTAL[1]), 1e-5
+    )
+    eye_ratio = (left_ratio + right_ratio) * 0.5
+
+    # Eyebrow raise relative to the upper-lid anchor (y components only)
+    left_brow_y = (
+        landmarks[1, LEFT_EYEBROW[0]]
+        + landmarks[1, LEFT_EYEBROW[1]]
+        + landmarks[1, LEFT_EYEBROW[2]]
+    ) / 3.0
+    right_brow_y = (
+        landmarks[1, RIGHT_EYEBROW[0]]
+        + landmarks[1, RIGHT_EYEBROW[1]]
+        + landmarks[1, RIGHT_EYEBROW[2]]
+    ) / 3.0
+    anchor_y = (landmarks[1, LEFT_EYE_LIDS[0]] + landmarks[1, RIGHT_EYE_LIDS[0]]) * 0.5
+    brow_raise = (abs(left_brow_y - anchor_y) + abs(right_brow_y - anchor_y)) * 0.5
+
+    # Mouth width/height ratio (raw; caller maps it into 0-1)
+    mouth_width = _dist(landmarks, LEFT_LIP_CORNER, RIGHT_LIP_CORNER)
+    mouth_height = _dist(landmarks, TOP_LIP, BOTTOM_LIP)
+    lip_ratio = mouth_width / max(mouth_height, 1e-5)
+
+    # Vertical nose movement normalized by face length
+    nose_y = landmarks[1, NOSE_TIP]
+    chin_y = landmarks[1, CHIN]
+    head_length = abs(chin_y - nose_y)
+    if has_prev:
+        nod_delta = abs(nose_y - prev_nose_y) / max(head_length, 1e-5)
+    else:
+        nod_delta = 0.0
+
+    # Cheek-to-nose distance asymmetry
+    left_dist = _dist(landmarks, LEFT_CHEEK, NOSE_TIP)
+    right_dist = _dist(landmarks, RIGHT_CHEEK, NOSE_TIP)
+    symmetry = abs(left_dist - right_dist) / max((left_dist + right_dist) * 0.5, 1e-5)
+
+    return eye_ratio, brow_raise, lip_ratio, nod_delta, symmetry, float(nose_y)
@@ -10,7 +10,7 @@ import numpy as np
 from . import data_logger
 from .dashboard import Dashboard
 from .face_mesh_module import iter_landmarks_from_camera, LandmarkFrame
-from .feature_engineering import FeatureExtractor
+from .feature_engineering import FEATURE_KEYS, FeatureExtractor
 from .stress_model import StressEstimator, StressScore
 
 # ── Colour palette (BGR) ────────────────────────────────────────────
@@ -28,13 +28,16 @@ LANDMARK_COLOR = (200, 220, 200)
 
 WINDOW = "AI Micro-Expression Analyzer"
 PANEL_W = 320  # width of side panel
+LANDMARK_STRIDE = 4  # draw every Nth landmark dot in the overlay
 
 
 # ── Draw face-mesh dots on the camera image ─────────────────────────
 def draw_landmarks(image: np.ndarray, landmarks: np.ndarray) -> None:
     h, w = image.shape[:2]
-    for lm in landmarks:
-        x, y = int(lm[0] * w), int(lm[1] * h)
+    # Scale all normalized coordinates to pixels in one vectorized pass;
+    # only the unavoidable cv2.circle calls stay in the Python loop.
+    coords = (landmarks[:, :2] * (w, h)).astype(np.int32)
+    for x, y in coords.tolist():
         cv2.circle(image, (x, y), 1, LANDMARK_COLOR, -1)
 
 
@@ -48,86 +51,159 @@ def draw_bar(
     ratio: float,
     color: Tuple[int, int, int],
 ) -> None:
-    ratio = float(np.clip(ratio, 0.0, 1.0))
-    cv2.rectangle(panel, (x, y), (x + bar_w, y + bar_h), BAR_BG, -1)
+    ratio = min(1.0, max(0.0, float(ratio)))
+    # Solid fills are plain slice stores; cv2.rectangle stays only for
+    # the 1-px border
+    panel[y:y + bar_h, x:x + bar_w] = BAR_BG
     fill_w = int(bar_w * ratio)
     if fill_w > 0:
-        cv2.rectangle(panel, (x, y), (x + fill_w, y + bar_h), color, -1)
+        panel[y:y + bar_h, x:x + fill_w] = color
     cv2.rectangle(panel, (x, y), (x + bar_w, y + bar_h), WHITE, 1)
 
 
-# ── Build the side panel ────────────────────────────────────────────
-def build_panel(
-    height: int,
-    features: Dict[str, float],
-    stress: StressScore,
-) -> np.ndarray:
-    panel = np.full((height, PANEL_W, 3), DARK_BG, dtype=np.uint8)
-    color = COLORS.get(stress.level, WHITE)
-
-    # ── Stress banner ───────────────────────────────────────────
-    banner_h = 80
-    cv2.rectangle(panel, (0, 0), (PANEL_W, banner_h), color, -1)
-    level_text = stress.label.upper()
-    cv2.putText(panel, level_text, (15, 35),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.8, BLACK, 2, cv2.LINE_AA)
-    cv2.putText(panel, f"Score: {stress.score:.2f}", (15, 65),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.6, BLACK, 1, cv2.LINE_AA)
-
-    # ── Metric bars ─────────────────────────────────────────────
-    pretty = {
-        "eyebrow_raise": ("Eyebrow Raise", 0.08),
-        "lip_tension": ("Lip Tension", 1.0),
-        "head_nod_intensity": ("Head Nod", 1.5),
-        "symmetry_delta": ("Symmetry", 0.05),
-        "blink_rate": ("Blink Rate /min", 30.0),
-    }
-    y = banner_h + 25
-    bar_w = PANEL_W - 40
-    bar_h = 18
-    for key, (label, scale) in pretty.items():
-        val = features.get(key, 0.0)
-        ratio = val / scale
-        cv2.putText(panel, f"{label}: {val:.3f}", (15, y),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.45, WHITE, 1, cv2.LINE_AA)
-        draw_bar(panel, 15, y + 5, bar_w, bar_h, ratio, color)
-        y += bar_h + 30
-
-    # ── Legend ──────────────────────────────────────────────────
-    y += 10
-    for lvl, (r, g, b) in COLORS.items():
-        cv2.circle(panel, (25, y), 8, (r, g, b), -1)
-        cv2.putText(panel, lvl.capitalize(), (42, y + 5),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, WHITE, 1, cv2.LINE_AA)
-        y += 28
-
-    # ── Instructions ───────────────────────────────────────────
-    cv2.putText(panel, "Press 'q' to quit", (15, height - 20),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.45, GRAY, 1, cv2.LINE_AA)
-    return panel
+# ── Side panel rendering ────────────────────────────────────────────
+class PanelRenderer:
+    """Renders the side panel, caching everything static across frames.
+
+    The dark background, metric labels, legend, and instructions never
+    change, so they are rasterized once into a template that each frame
+    starts from; only the stress banner, metric values, and bars are
+    redrawn per frame.
+    """
+
+    METRICS: Tuple[Tuple[str, str, float], ...] = (
+        ("eyebrow_raise", "Eyebrow Raise", 0.08),
+        ("lip_tension", "Lip Tension", 1.0),
+        ("head_nod_intensity", "Head Nod", 1.5),
+        ("symmetry_delta", "Symmetry", 0.05),
+        ("blink_rate", "Blink Rate /min", 30.0),
+    )
+    BANNER_H = 80
+    BAR_W = PANEL_W - 40
+    BAR_H = 18
+    FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+    def __init__(self) -> None:
+        self._template: np.ndarray | None = None
+        self._panel: np.ndarray | None = None  # reused output buffer
+        # Pre-rendered banner strip (fill + level text) per stress level
+        self._banner_cache: Dict[str, np.ndarray] = {}
+        # Last rendered value and its pixel strip per metric, so text
+        # that has not visibly changed is blitted instead of re-rendered
+        self._value_cache: Dict[str, Tuple[float, np.ndarray]] = {}
+        # (key, value_x, text_y, bar_y, scale) per metric row
+        self._rows: Tuple[Tuple[str, int, int, int, float], ...] = ()
+
+    def _build_template(self, height: int) -> np.ndarray:
+        panel = np.full((height, PANEL_W, 3), DARK_BG, dtype=np.uint8)
+
+        # ── Metric labels ───────────────────────────────────────
+        rows = []
+        y = self.BANNER_H + 25
+        for key, label, scale in self.METRICS:
+            text = f"{label}:"
+            cv2.putText(panel, text, (15, y),
+                        self.FONT, 0.45, WHITE, 1, cv2.LINE_AA)
+            (label_w, _), _ = cv2.getTextSize(text, self.FONT, 0.45, 1)
+            rows.append((key, 15 + label_w + 8, y, y + 5, scale))
+            y += self.BAR_H + 30
+        self._rows = tuple(rows)
+
+        # ── Legend ──────────────────────────────────────────────
+        y += 10
+        for lvl, (r, g, b) in COLORS.items():
+            cv2.circle(panel, (25, y), 8, (r, g, b), -1)
+            cv2.putText(panel, lvl.capitalize(), (42, y + 5),
+                        self.FONT, 0.5, WHITE, 1, cv2.LINE_AA)
+            y += 28
+
+        # ── Instructions ────────────────────────────────────────
+        cv2.putText(panel, "Press 'q' to quit", (15, height - 20),
+                    self.FONT, 0.45, GRAY, 1, cv2.LINE_AA)
+        return panel
+
+    def render(
+        self,
+        height: int,
+        features: Dict[str, float],
+        stress: StressScore,
+    ) -> np.ndarray:
+        if self._template is None or self._template.shape[0] != height:
+            self._template = self._build_template(height)
+            self._panel = np.empty_like(self._template)
+        # Reset the reused buffer from the template instead of allocating
+        panel = self._panel
+        np.copyto(panel, self._template)
+        color = COLORS.get(stress.level, WHITE)
+
+        # ── Stress banner ───────────────────────────────────────
+        # Rasterizing the big level text is the priciest putText call;
+        # the banner only has three variants, so blit a cached strip
+        # and redraw just the score.
+        banner = self._banner_cache.get(stress.level)
+        if banner is None:
+            banner = np.empty((self.BANNER_H, PANEL_W, 3), dtype=np.uint8)
+            banner[:] = color
+            cv2.putText(banner, stress.label.upper(), (15, 35),
+                        self.FONT, 0.8, BLACK, 2, cv2.LINE_AA)
+            self._banner_cache[stress.level] = banner
+        panel[:self.BANNER_H] = banner
+        cv2.putText(panel, f"Score: {stress.score:.2f}", (15, 65),
+                    self.FONT, 0.6, BLACK, 1, cv2.LINE_AA)
+
+        # ── Metric values + bars ────────────────────────────────
+        for key, value_x, text_y, bar_y, scale in self._rows:
+            val = features.get(key, 0.0)
+            strip_top, strip_bottom = text_y - 14, text_y + 4
+            cached = self._value_cache.get(key)
+            if cached is not None and abs(val - cached[0]) < 5e-4:
+                # Below display precision: reuse the rendered pixels
+                panel[strip_top:strip_bottom, value_x:] = cached[1]
+            else:
+                cv2.putText(panel, f"{val:.3f}", (value_x, text_y),
+                            self.FONT, 0.45, WHITE, 1, cv2.LINE_AA)
+                self._value_cache[key] = (
+                    val,
+                    panel[strip_top:strip_bottom, value_x:].copy(),
+                )
+            draw_bar(panel, 15, bar_y, self.BAR_W, self.BAR_H, val / scale, color)
+        return panel
 
 
 # ── Combine camera feed + panel into one window ─────────────────────
 def render_frame(
+    canvas: np.ndarray,
     frame: LandmarkFrame,
     features: Dict[str, float],
     stress: StressScore,
-) -> np.ndarray:
-    image = frame.image.copy()
-    draw_landmarks(image, frame.landmarks)
+    panel_renderer: PanelRenderer,
+) -> None:
+    # Draw straight onto the camera frame: nothing downstream needs the
+    # pristine image, so skipping the copy saves a full-frame memcpy.
+    image = frame.image
+    draw_landmarks(image, frame.landmarks[::LANDMARK_STRIDE])
 
     # Thin coloured border around the video
     border_color = COLORS.get(stress.level, WHITE)
     cv2.rectangle(image, (0, 0),
                   (image.shape[1] - 1, image.shape[0] - 1), border_color, 3)
 
-    panel = build_panel(image.shape[0], features, stress)
-    combined = np.hstack([image, panel])
-    return combined
+    panel = panel_renderer.render(image.shape[0], features, stress)
+    # Copy into slices of the caller's reused canvas rather than letting
+    # np.hstack allocate a fresh combined buffer every frame
+    width = image.shape[1]
+    canvas[:, :width] = image
+    canvas[:, width:] = panel
 
 
 # ── Main loop ───────────────────────────────────────────────────────
-def run(camera_index: int, log_path: pathlib.Path, display: bool, verbose: bool) -> None:
+def run(
+    camera_index: int,
+    log_path: pathlib.Path,
+    display: bool,
+    verbose: bool,
+    detect_width: int | None = None,
+) -> None:
     extractor = FeatureExtractor()
     estimator = StressEstimator()
     fields = [
@@ -139,11 +215,15 @@ def run(camera_index: int, log_path: pathlib.Path, display: bool, verbose: bool)
         "stress_score",
     ]
     dashboard = Dashboard(verbose=verbose)
+    panel_renderer = PanelRenderer()
+    canvas: np.ndarray | None = None
 
     with data_logger.DataLogger(log_path, fieldnames=fields) as logger:
-        for frame in iter_landmarks_from_camera(camera_index):
-            features = extractor.extract(frame)
-            stress_score = estimator.predict(features)
+        for frame in iter_landmarks_from_camera(camera_index, detect_width=detect_width):
+            feature_vector = extractor.extract(frame)
+            stress_score = estimator.predict(feature_vector)
+            # Dict views are only built here, at the display/logging boundary.
+            features = dict(zip(FEATURE_KEYS, feature_vector.tolist()))
             metrics = {**features, "stress_score": stress_score.score}
 
             # Terminal output (always)
@@ -152,7 +232,10 @@ def run(camera_index: int, log_path: pathlib.Path, display: bool, verbose: bool)
 
             # OpenCV visual output
             if display and frame.image is not None:
-                canvas = render_frame(frame, features, stress_score)
+                h, w = frame.image.shape[:2]
+                if canvas is None or canvas.shape[:2] != (h, w + PANEL_W):
+                    canvas = np.empty((h, w + PANEL_W, 3), dtype=np.uint8)
+                render_frame(canvas, frame, features, stress_score, panel_renderer)
                 cv2.imshow(WINDOW, canvas)
                 if cv2.waitKey(1) & 0xFF == ord("q"):
                     break
@@ -180,6 +263,13 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print full metric breakdown to terminal",
     )
+    parser.add_argument(
+        "--detect-width",
+        type=int,
+        default=None,
+        help="Downscale frames to this width before landmark detection "
+        "(display keeps full resolution)",
+    )
     return parser.parse_args()
 
 
@@ -190,6 +280,7 @@ def main() -> None:
         log_path=args.log_path,
         display=not args.no_display,
         verbose=args.verbose,
+        detect_width=args.detect_width,
     )
 
 
@@ -11,6 +11,11 @@ OUTPUT_LABELS: Dict[str, Tuple[str, str]] = {
     "high": ("🔴", "High Stress / Possible Deception Indicators"),
 }
 
+# Index-ordered views of OUTPUT_LABELS so classification is a single
+# searchsorted plus two tuple lookups instead of branches and dict hashing
+_LEVELS = ("calm", "mild", "high")
+_LEVEL_LABELS = tuple(OUTPUT_LABELS[level] for level in _LEVELS)
+
 
 @dataclass
 class StressScore:
@@ -25,38 +30,20 @@ class StressScore:
 
 class StressEstimator:
     def __init__(self) -> None:
-        # Weights reflect heuristic importance of each feature
-        self.weights = {
-            "eyebrow_raise": 0.3,
-            "lip_tension": 0.25,
-            "head_nod_intensity": 0.2,
-            "symmetry_delta": 0.15,
-            "blink_rate": 0.1,
-        }
-        self.scalers = {
-            "eyebrow_raise": 0.08,   # typical range 0.02–0.08
-            "lip_tension": 1.0,      # normalized 0–1
-            "head_nod_intensity": 1.5,  # smoothed delta; calm ≈ 0–0.3
-            "symmetry_delta": 0.05,  # typical range 0–0.05
-            "blink_rate": 30.0,      # blinks per minute; >20 elevated
-        }
-        self.thresholds = {
-            "calm": 0.35,
-            "mild": 0.65,
-        }
-
-    def predict(self, features: Dict[str, float]) -> StressScore:
-        weighted_sum = 0.0
-        for key, value in features.items():
-            weight = self.weights.get(key, 0.0)
-            scale = self.scalers.get(key, 1.0)
-            weighted_sum += weight * min(value / scale, 1.5)
+        # Weights and scalers follow the feature_engineering.FEATURE_KEYS
+        # order, reflecting heuristic importance of each feature
+        self._weights = np.array([0.3, 0.25, 0.2, 0.15, 0.1])
+        # Typical ranges: eyebrow 0.02–0.08, lip tension normalized 0–1,
+        # nod smoothed delta (calm ≈ 0–0.3), symmetry 0–0.05, blink
+        # rate per minute (>20 elevated)
+        self._scalers = np.array([0.08, 1.0, 1.5, 0.05, 30.0])
+        # Upper score bounds for calm and mild; anything above is high
+        self._thresholds = np.array([0.35, 0.65])
+
+    def predict(self, features: np.ndarray) -> StressScore:
+        """Score a feature vector ordered as feature_engineering.FEATURE_KEYS."""
+        weighted_sum = np.minimum(features / self._scalers, 1.5) @ self._weights
         score = float(np.clip(weighted_sum, 0.0, 1.5))
-        if score < self.thresholds["calm"]:
-            label_key = "calm"
-        elif score < self.thresholds["mild"]:
-            label_key = "mild"
-        else:
-            label_key = "high"
-        icon, label = OUTPUT_LABELS[label_key]
-        return StressScore(score=score, icon=icon, label=label, level=label_key)
+        index = int(np.searchsorted(self._thresholds, score, side="right"))
+        icon, label = _LEVEL_LABELS[index]
+        return StressScore(score=score, icon=icon, label=label, level=_LEVELS[index])